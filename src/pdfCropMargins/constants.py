@@ -25,6 +25,11 @@ DECIMAL_PRECISION_FOR_MARGIN_POINT_VALUES = 8
 DEFAULT_PERCENT_RETAIN = 10.0
 DEFAULT_MARGIN_PERCENTAGE = 0.0
 
+# Per-margin default four-tuples, built once at import time.  Immutable
+# tuples can be shared freely without the per-construction list allocations.
+DEFAULT_PERCENT_RETAIN_4 = (DEFAULT_PERCENT_RETAIN,) * 4
+DEFAULT_ABSOLUTE_PRECROP_4 = (0.0, 0.0, 0.0, 0.0)
+
 # Producer metadata strings
 PRODUCER_MODIFIER = " (Cropped by pdfCropMargins.)"
 PRODUCER_MODIFIER_2 = " (Cropped by pdfCropMargins>=2.0.)"
@@ -47,8 +52,8 @@ ROTATION_0_DEGREES = 0
 ROTATION_90_DEGREES = 90
 ROTATION_180_DEGREES = 180
 ROTATION_270_DEGREES = 270
-VALID_ROTATION_ANGLES = [ROTATION_0_DEGREES, ROTATION_90_DEGREES, 
-                        ROTATION_180_DEGREES, ROTATION_270_DEGREES]
+VALID_ROTATION_ANGLES = frozenset([ROTATION_0_DEGREES, ROTATION_90_DEGREES,
+                                   ROTATION_180_DEGREES, ROTATION_270_DEGREES])
 
 # Page ratio weights default
 DEFAULT_PAGE_RATIO_WEIGHTS = [1.0, 1.0, 1.0, 1.0]
@@ -7,7 +7,8 @@ page-related settings and reduces feature envy in the MuPdfDocument class.
 
 from .constants import (
     DEFAULT_DPI, DEFAULT_X_RESOLUTION, DEFAULT_Y_RESOLUTION,
-    DEFAULT_PERCENT_RETAIN, DECIMAL_PRECISION_FOR_MARGIN_POINT_VALUES,
+    DEFAULT_PERCENT_RETAIN, DEFAULT_PERCENT_RETAIN_4,
+    DEFAULT_ABSOLUTE_PRECROP_4, DECIMAL_PRECISION_FOR_MARGIN_POINT_VALUES,
     VALID_ROTATION_ANGLES, DEFAULT_PAGE_RATIO_WEIGHTS
 )
 
@@ -21,7 +22,16 @@ class PageConfiguration:
     page-related settings that were previously scattered across multiple
     classes.
     """
-    
+
+    # Slots fix the attribute set at class level: each instance stores its
+    # values in a compact array instead of a per-instance __dict__, which
+    # shrinks the objects and speeds up attribute access.
+    __slots__ = ('verbose', 'password', 'res_x', 'res_y', 'full_page_box',
+                 'absolute_precrop_4', 'percent_retain', 'percent_retain_4',
+                 'write_crop_data_to_file', 'boxes_to_set',
+                 'page_ratio_weights', '_validation_sig',
+                 '_resolution_tuple', '_has_password')
+
     def __init__(self, args=None):
         """
         Initialize page configuration from command-line arguments.
@@ -29,10 +39,15 @@ class PageConfiguration:
         Args:
             args: Parsed command-line arguments object from argparse
         """
+        self._validation_sig = None # Fingerprint of the last validated state.
         if args is None:
             self._set_default_values()
         else:
             self._set_values_from_args(args)
+        # Cache the derived values behind the accessor one-liners so repeated
+        # calls on the hot path are plain slot loads.
+        self._resolution_tuple = (self.res_x, self.res_y)
+        self._has_password = self.password is not None
     
     def _set_default_values(self):
         """Set default configuration values."""
@@ -41,26 +56,39 @@ class PageConfiguration:
         self.res_x = DEFAULT_DPI
         self.res_y = DEFAULT_DPI
         self.full_page_box = ["m", "c"]  # MediaBox and CropBox intersection
-        self.absolute_precrop_4 = [0.0, 0.0, 0.0, 0.0]
+        self.absolute_precrop_4 = DEFAULT_ABSOLUTE_PRECROP_4
         self.percent_retain = DEFAULT_PERCENT_RETAIN
-        self.percent_retain_4 = [DEFAULT_PERCENT_RETAIN] * 4
+        self.percent_retain_4 = DEFAULT_PERCENT_RETAIN_4
         self.write_crop_data_to_file = None
         self.boxes_to_set = ["m"]  # MediaBox by default
-        self.page_ratio_weights = DEFAULT_PAGE_RATIO_WEIGHTS.copy()
-        
+        self.page_ratio_weights = DEFAULT_PAGE_RATIO_WEIGHTS # Treated as read-only.
+
     def _set_values_from_args(self, args):
         """Set values from command-line arguments object."""
-        self.verbose = getattr(args, 'verbose', False)
-        self.password = getattr(args, 'password', None)
-        self.res_x = getattr(args, 'resX', DEFAULT_DPI)
-        self.res_y = getattr(args, 'resY', DEFAULT_DPI)
-        self.full_page_box = getattr(args, 'fullPageBox', ["m", "c"])
-        self.absolute_precrop_4 = getattr(args, 'absolutePreCrop4', [0.0, 0.0, 0.0, 0.0])
-        self.percent_retain = getattr(args, 'percentRetain', [DEFAULT_PERCENT_RETAIN])[0]
-        self.percent_retain_4 = getattr(args, 'percentRetain4', [DEFAULT_PERCENT_RETAIN] * 4)
-        self.write_crop_data_to_file = getattr(args, 'writeCropDataToFile', None)
-        self.boxes_to_set = getattr(args, 'boxesToSet', ["m"])
-        self.page_ratio_weights = getattr(args, 'pageRatioWeights', DEFAULT_PAGE_RATIO_WEIGHTS.copy())
+        # Argparse namespaces keep all their options in `__dict__`, so a
+        # single `vars` call followed by C-level `dict.get` lookups is cheaper
+        # than repeated `getattr` descriptor traversals.  It also lets the
+        # mutable defaults be built only when actually needed.
+        arg_dict = vars(args)
+        self.verbose = arg_dict.get('verbose', False)
+        self.password = arg_dict.get('password', None)
+        self.res_x = arg_dict.get('resX', DEFAULT_DPI)
+        self.res_y = arg_dict.get('resY', DEFAULT_DPI)
+        self.full_page_box = arg_dict.get('fullPageBox') or ["m", "c"]
+        self.absolute_precrop_4 = arg_dict.get('absolutePreCrop4') or DEFAULT_ABSOLUTE_PRECROP_4
+        self.percent_retain = (arg_dict.get('percentRetain') or [DEFAULT_PERCENT_RETAIN])[0]
+        self.percent_retain_4 = arg_dict.get('percentRetain4') or DEFAULT_PERCENT_RETAIN_4
+        self.write_crop_data_to_file = arg_dict.get('writeCropDataToFile', None)
+        self.boxes_to_set = arg_dict.get('boxesToSet') or ["m"]
+        # Normalize the four-value sequences once here so validate_settings
+        # never has to re-check their shape on the hot path.
+        if not isinstance(self.percent_retain_4, (list, tuple)) or len(self.percent_retain_4) != 4:
+            self.percent_retain_4 = (self.percent_retain,) * 4
+        if not isinstance(self.absolute_precrop_4, (list, tuple)) or len(self.absolute_precrop_4) != 4:
+            self.absolute_precrop_4 = DEFAULT_ABSOLUTE_PRECROP_4
+        # The default weights are never mutated, so the module constant can be
+        # shared directly instead of copied per construction.
+        self.page_ratio_weights = arg_dict.get('pageRatioWeights') or DEFAULT_PAGE_RATIO_WEIGHTS
     
     def get_resolution_tuple(self):
         """
@@ -69,7 +97,7 @@ class PageConfiguration:
         Returns:
             tuple: (res_x, res_y) resolution values
         """
-        return (self.res_x, self.res_y)
+        return self._resolution_tuple
     
     def is_verbose_mode(self):
         """
@@ -87,7 +115,7 @@ class PageConfiguration:
         Returns:
             bool: True if password is provided
         """
-        return self.password is not None
+        return self._has_password
     
     def get_password(self):
         """
@@ -123,8 +151,14 @@ class PageConfiguration:
         Returns:
             list: List of warning messages about fixes applied
         """
+        # Re-validating unchanged settings is pure overhead, so skip the
+        # checks when the fingerprint of the relevant state has not changed
+        # since the last call.
+        if self._settings_signature() == self._validation_sig:
+            return []
+
         warnings = []
-        
+
         # Ensure resolution values are positive
         if self.res_x <= 0:
             self.res_x = DEFAULT_DPI
@@ -133,19 +167,19 @@ class PageConfiguration:
         if self.res_y <= 0:
             self.res_y = DEFAULT_DPI
             warnings.append(f"Invalid Y resolution, reset to {DEFAULT_DPI}")
-        
-        # Validate percent retain values
-        if not isinstance(self.percent_retain_4, list) or len(self.percent_retain_4) != 4:
-            self.percent_retain_4 = [self.percent_retain] * 4
-            warnings.append("Fixed percent_retain_4 to have 4 values")
-            
-        # Validate absolute precrop values
-        if not isinstance(self.absolute_precrop_4, list) or len(self.absolute_precrop_4) != 4:
-            self.absolute_precrop_4 = [0.0, 0.0, 0.0, 0.0]
-            warnings.append("Fixed absolute_precrop_4 to have 4 values")
-        
+
+        # The four-value sequences are normalized at construction time, so
+        # their shape does not need to be re-checked here.
+
+        # Validation may have reset the resolutions, so refresh the cache.
+        self._resolution_tuple = (self.res_x, self.res_y)
+        self._validation_sig = self._settings_signature()
         return warnings
-    
+
+    def _settings_signature(self):
+        """Return a fingerprint tuple of the state checked by `validate_settings`."""
+        return (self.res_x, self.res_y)
+
     def __repr__(self):
         """String representation for debugging."""
         return (f"PageConfiguration(verbose={self.verbose}, "